@@ -1,24 +1,590 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException
-from typing import Dict, Any
+from fastapi import APIRouter, UploadFile, File, HTTPException, Request
+from typing import Dict, Any, BinaryIO, List, Optional, Tuple
 import pandas as pd
+import numpy as np
+import polars as pl
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from pyarrow import csv as pa_csv
+from pandas.api.types import is_float_dtype, is_integer_dtype, is_object_dtype
+import asyncio
+from concurrent.futures.process import BrokenProcessPool
+from collections import OrderedDict
 import os
+import re
 import uuid
 from pathlib import Path
-import aiofiles
+from diskcache import Cache
+import orjson
+import xxhash
 
 from app.core.config import settings
+from app.core.pool import create_analysis_pool
+from app.core.responses import NumpyORJSONResponse
 
 api_router = APIRouter()
 
 # Ensure temp directory exists
 os.makedirs(settings.TEMP_DIR, exist_ok=True)
 
-# In-memory storage for dataset metadata
+# Dataset metadata shared by all worker processes and kept across restarts
 # In production, this should be replaced with a database
-datasets_metadata: Dict[str, Dict[str, Any]] = {}
+datasets_metadata = Cache(os.path.join(settings.TEMP_DIR, "meta"))
+
+# Analysis results by dataset ID; uploaded files never change, so results stay valid
+_analysis_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+# Wider types tried, in order, when a later CSV block does not fit a column's inferred type
+_CSV_WIDER_TYPES = {
+    pa.null(): [pa.int64(), pa.float64(), pa.bool_(), pa.date32(), pa.timestamp('s')],
+    pa.int64(): [pa.float64()],
+    pa.date32(): [pa.timestamp('s')],
+}
+
+_CSV_CONVERSION_ERROR = re.compile(r"In CSV column #(\d+): .*CSV conversion error to .*: invalid value '(.*)'$", re.S)
+
+
+def _widen_csv_type(current: pa.DataType, value: str) -> pa.DataType:
+    """Pick the narrowest type wider than current that can hold value"""
+    for candidate in _CSV_WIDER_TYPES.get(current, []):
+        try:
+            pc.cast(pa.array([value]), candidate)
+            return candidate
+        except pa.ArrowInvalid:
+            continue
+    return pa.string()
+
+
+def _read_csv_table(file_path: str) -> pa.Table:
+    """Stream a CSV into an Arrow table one block at a time.
+    
+    pyarrow.csv.read_csv holds much of the raw file in parse buffers on top of
+    the table it builds; the streaming reader only keeps a few blocks. It fixes
+    column types from the first block, so when a later block does not fit
+    (e.g. a float further down an int column) that column is widened and the
+    file is read again from the start.
+    """
+    column_types: Dict[str, pa.DataType] = {}
+    while True:
+        reader = None
+        try:
+            reader = pa_csv.open_csv(
+                file_path,
+                convert_options=pa_csv.ConvertOptions(
+                    strings_can_be_null=True,
+                    column_types=column_types
+                )
+            )
+            return reader.read_all()
+        except pa.ArrowInvalid as e:
+            match = _CSV_CONVERSION_ERROR.match(str(e))
+            if reader is None or match is None:
+                raise pd.errors.ParserError(str(e)) from e
+            field = reader.schema.field(int(match.group(1)))
+            column_types[field.name] = _widen_csv_type(field.type, match.group(2))
+
+
+def _read_csv(file_path: str) -> pd.DataFrame:
+    """Parse a CSV with PyArrow, compacting text columns before converting to pandas.
+    
+    Repetitive text columns are dictionary-encoded in Arrow and arrive as
+    category, so no per-row Python strings are ever built for them; mostly-unique
+    ones become object. This is the split _shrink_dtypes makes for other
+    formats, decided here once per column. The table is converted in a single
+    self-destructing to_pandas() call, which frees each Arrow column as soon as
+    pandas owns a copy of it.
+    """
+    table = _read_csv_table(file_path)
+    
+    for i, column in enumerate(table.columns):
+        if pa.types.is_null(column.type):
+            # Columns with no values at all; pandas' pyarrow engine makes these float64 too
+            table = table.set_column(i, table.field(i).name, column.cast(pa.float64()))
+        elif pa.types.is_string(column.type) and pc.count_distinct(column).as_py() < table.num_rows * 0.5:
+            table = table.set_column(i, table.field(i).name, column.dictionary_encode())
+    del column
+    # Hand the distinct-count hash tables back to the OS before pandas allocates its copy
+    pa.default_memory_pool().release_unused()
+    
+    # Text left unencoded is mostly unique, so de-duplicating it would only cost a hash table
+    df = table.to_pandas(self_destruct=True, split_blocks=True, deduplicate_objects=False)
+    del table
+    
+    for i, dtype in enumerate(df.dtypes):
+        if isinstance(dtype, pd.CategoricalDtype):
+            # Arrow keeps first-seen order; sort like astype('category') does
+            df.isetitem(i, df.iloc[:, i].cat.reorder_categories(dtype.categories.sort_values()))
+    
+    return df
+
+
+# Reader for each supported file type; all return a pandas DataFrame
+_READERS = {
+    '.csv': _read_csv,
+    '.xlsx': pd.read_excel,
+    '.xls': pd.read_excel,
+    '.json': pd.read_json,
+    '.parquet': pd.read_parquet,
+}
+
+# Extra keyword arguments passed to each reader
+_READER_KWARGS: Dict[str, Dict[str, Any]] = {
+    # Calamine streams sheets in Rust instead of building openpyxl's XML DOM
+    '.xlsx': {'engine': 'calamine'},
+    '.xls': {'engine': 'calamine'},
+    '.parquet': {'engine': 'pyarrow'},
+}
+
+# Supported file types (a tuple so it can be passed straight to str.endswith)
+SUPPORTED_EXTENSIONS = tuple(_READERS)
+
+# Uploads are streamed to disk in chunks of this size (1MB)
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Values hashed per step when counting distinct values with an early exit
+DISTINCT_COUNT_BLOCK = 65536
+
+# Sums below this are treated as floating-point error, as pandas does for skew and kurtosis
+FP_ERROR_TOLERANCE = 1e-14
+
+
+def _save_upload(src: BinaryIO, file_path: str, max_size: int) -> Tuple[int, str]:
+    """Copy an upload to disk in chunks, stopping once it exceeds max_size.
+    
+    Returns the number of bytes written and the 128-bit xxh3 hash of the content. Runs
+    in a worker thread so the whole copy costs a single executor hop.
+    """
+    file_size = 0
+    hasher = xxhash.xxh3_128()
+    with open(file_path, 'wb') as f:
+        while chunk := src.read(UPLOAD_CHUNK_SIZE):
+            file_size += len(chunk)
+            if file_size > max_size:
+                break
+            hasher.update(chunk)
+            f.write(chunk)
+    return file_size, hasher.hexdigest()
+
+
+def _distinct_count_capped(series: pd.Series, cap: int) -> int:
+    """Count distinct non-null values, stopping as soon as the count exceeds cap.
+    
+    Values are hashed one block at a time, so a mostly-unique column is
+    rejected after roughly cap values instead of hashing the whole column.
+    The result is exact when it is <= cap.
+    """
+    values = series.to_numpy()
+    seen = set()
+    for start in range(0, len(values), DISTINCT_COUNT_BLOCK):
+        block = values[start:start + DISTINCT_COUNT_BLOCK]
+        seen.update(block[~pd.isna(block)])
+        if len(seen) > cap:
+            break
+    return len(seen)
+
+
+def _shrink_dtypes(df: pd.DataFrame, categorize_text: bool = True) -> pd.DataFrame:
+    """Downcast integer columns and store repetitive text columns as category.
+    
+    The analysis passes are memory-bound, so a smaller frame is a faster one.
+    Floats stay float64: float32 would leak rounding noise into the preview
+    and statistics. categorize_text=False skips the object columns, for
+    readers that already made that decision.
+    """
+    # Columns are addressed by position so repeated labels cannot collide, and
+    # dtypes are checked directly because select_dtypes(np.integer) also
+    # matches timedelta64, which to_numeric would turn into nanosecond ints
+    for i, dtype in enumerate(df.dtypes):
+        if is_integer_dtype(dtype):
+            df.isetitem(i, pd.to_numeric(df.iloc[:, i], downcast='integer'))
+        elif categorize_text and is_object_dtype(dtype):
+            if _distinct_count_capped(df.iloc[:, i], len(df) // 2) < len(df) * 0.5:
+                df.isetitem(i, df.iloc[:, i].astype('category'))
+    
+    return df
+
+
+def _dedupe_columns(columns: pd.Index) -> List[Any]:
+    """Rename repeated column labels to a, a.1, a.2, ... like pandas' C parser.
+    
+    The pyarrow CSV reader keeps duplicate header names as-is, which breaks
+    every df[col] lookup that expects a single column back. As in pandas,
+    suffixes that already appear in the header are skipped, so a,a,a.1
+    becomes a,a.2,a.1.
+    """
+    header = set(columns)
+    counts: Dict[Any, int] = {}
+    names = []
+    for name in columns:
+        count = counts.get(name, 0)
+        if count > 0:
+            base = name
+            while count > 0:
+                counts[base] = count + 1
+                name = f"{base}.{count}"
+                count = count + 1 if name in header else counts.get(name, 0)
+        counts[name] = count + 1
+        names.append(name)
+    return names
+
+
+def _read_dataframe(file_path: str, file_ext: str) -> Optional[pd.DataFrame]:
+    """Load a dataset file with the pandas reader matching its extension"""
+    reader = _READERS.get(file_ext)
+    if reader is None:
+        return None
+    
+    df = reader(file_path, **_READER_KWARGS.get(file_ext, {}))
+    
+    if df.columns.has_duplicates:
+        df.columns = _dedupe_columns(df.columns)
+    
+    # _read_csv already split its text columns by cardinality
+    return _shrink_dtypes(df, categorize_text=file_ext != '.csv')
+
+
+def _sidecar_path(file_path: str) -> str:
+    """Path of the parquet copy written next to an uploaded file"""
+    return f"{file_path}.pq"
+
+
+def _write_sidecar(df: pd.DataFrame, file_path: str) -> None:
+    """Persist a parsed frame as parquet so later loads skip the original parser.
+    
+    The file is written under a unique temporary name and renamed into place,
+    so concurrent uploads of the same content never see a half-written sidecar.
+    """
+    tmp_path = f"{_sidecar_path(file_path)}.{uuid.uuid4().hex}.tmp"
+    try:
+        df.to_parquet(tmp_path)
+        os.replace(tmp_path, _sidecar_path(file_path))
+    except Exception:
+        # Not every frame maps onto a parquet schema (e.g. mixed-type object
+        # columns); those datasets simply fall back to the original file
+        Path(tmp_path).unlink(missing_ok=True)
+
+
+def _load_dataframe(file_path: str, file_ext: str) -> Optional[pd.DataFrame]:
+    """Load a dataset from its parquet sidecar, or the original file as a last resort"""
+    sidecar_path = _sidecar_path(file_path)
+    if os.path.exists(sidecar_path):
+        return pd.read_parquet(sidecar_path)
+    return _read_dataframe(file_path, file_ext)
+
+
+def _upload_error(e: Exception) -> HTTPException:
+    """Map a failure while reading an uploaded file to the error returned to the client"""
+    if isinstance(e, HTTPException):
+        return e
+    # EmptyDataError and ParserError are ValueError subclasses, so check them first
+    if isinstance(e, pd.errors.EmptyDataError):
+        return HTTPException(status_code=400, detail="File is empty or invalid")
+    if isinstance(e, pd.errors.ParserError):
+        return HTTPException(status_code=400, detail=f"Failed to parse file: {str(e)}")
+    if isinstance(e, ValueError):
+        return HTTPException(status_code=400, detail=f"Invalid file format: {str(e)}")
+    return HTTPException(status_code=500, detail=f"Error processing file: {str(e)}")
+
+
+def _float_or_none(value: Any) -> Optional[float]:
+    """Convert a pandas/numpy scalar to float, mapping NaN to None"""
+    return None if pd.isna(value) else float(value)
+
+
+def _preview_records(df: pd.DataFrame) -> list:
+    """Serialize preview rows through pandas' C JSON writer.
+    
+    Avoids per-cell boxing of numpy scalars and Timestamps in to_dict(), and
+    maps NaN to null so the preview is valid JSON. to_json writes at most 15
+    significant digits, while float64 needs 17 to round-trip, so float columns
+    are copied in from the frame afterwards.
+    """
+    records = orjson.loads(df.to_json(orient='records', date_format='iso', double_precision=15))
+    for i, dtype in enumerate(df.dtypes):
+        if is_float_dtype(dtype):
+            key = str(df.columns[i])
+            for record, value in zip(records, df.iloc[:, i].tolist()):
+                record[key] = None if pd.isna(value) else value
+    return records
+
+
+def _lru_put(cache: OrderedDict, key: str, value: Any, max_size: int) -> None:
+    """Store a value in an LRU cache, evicting the least recently used entries"""
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > max_size:
+        cache.popitem(last=False)
+
+
+def _numeric_stats(df: pd.DataFrame, numeric_cols: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Summarize numeric columns with a single multi-threaded Polars query.
+    
+    All per-column aggregates are evaluated in one select, so Polars scans the
+    columns in parallel instead of pandas making a separate pass per statistic.
+    Results follow pandas' conventions (sample std, linear quantiles,
+    bias-corrected skewness and excess kurtosis).
+    """
+    # Positional names sidestep non-string or duplicated column labels
+    numeric_df = pl.from_pandas(
+        df[numeric_cols].set_axis([str(i) for i in range(len(numeric_cols))], axis=1)
+    )
+    row = numeric_df.select(
+        pl.all().count().name.suffix("/count"),
+        pl.all().mean().name.suffix("/mean"),
+        pl.all().std().name.suffix("/std"),
+        pl.all().min().name.suffix("/min"),
+        pl.all().quantile(0.25, interpolation="linear").name.suffix("/25%"),
+        pl.all().quantile(0.5, interpolation="linear").name.suffix("/50%"),
+        pl.all().quantile(0.75, interpolation="linear").name.suffix("/75%"),
+        pl.all().max().name.suffix("/max"),
+        pl.all().skew(bias=False).name.suffix("/skewness"),
+        pl.all().kurtosis(fisher=True, bias=False).name.suffix("/kurtosis"),
+        (pl.all() == 0).sum().name.suffix("/zeros_count"),
+        (pl.all() < 0).sum().name.suffix("/negative_count"),
+    ).row(0, named=True)
+    
+    numeric_stats = {}
+    for i, col in enumerate(numeric_cols):
+        stats = {key: row[f"{i}/{key}"] for key in (
+            "count", "mean", "std", "min", "25%", "50%", "75%", "max",
+            "skewness", "kurtosis", "zeros_count", "negative_count"
+        )}
+        count = stats["count"]
+        
+        # pandas reports NaN for too few values and 0 for constant columns. It
+        # treats sums below 1e-14 as floating-point error, so columns that are
+        # constant up to rounding (e.g. ten copies of 1/3) count as constant
+        # too; m2 is the sum of squared deviations from the mean
+        is_constant = stats["min"] == stats["max"]
+        m2 = stats["std"] ** 2 * (count - 1) if stats["std"] is not None else 0.0
+        if count < 3:
+            stats["skewness"] = None
+        elif is_constant or m2 < FP_ERROR_TOLERANCE:
+            stats["skewness"] = 0.0
+        if count < 4:
+            stats["kurtosis"] = None
+        elif is_constant or (count - 2) * (count - 3) * m2 ** 2 < FP_ERROR_TOLERANCE:
+            stats["kurtosis"] = 0.0
+        
+        numeric_stats[col] = {
+            "count": int(count),
+            **{key: _float_or_none(stats[key]) for key in (
+                "mean", "std", "min", "25%", "50%", "75%", "max", "skewness", "kurtosis"
+            )},
+            "zeros_count": int(stats["zeros_count"]),
+            "negative_count": int(stats["negative_count"])
+        }
+    
+    return numeric_stats
+
+
+def _categorical_stats(series: pd.Series, n_rows: int) -> Dict[str, Any]:
+    """Summarize the distinct values of a text or category column.
+    
+    Category columns are counted straight from their integer codes. Object
+    columns are checked with a capped distinct count first, so mostly-unique
+    columns are classified as high cardinality without hashing every value.
+    High-cardinality columns report unique_values as None whatever their
+    dtype, since object columns only have a capped count.
+    """
+    high_threshold = n_rows * 0.5
+    counts = None
+    
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        counts = series.value_counts(sort=False)
+        counts = counts[counts > 0]
+        unique_count = len(counts)
+    else:
+        unique_count = _distinct_count_capped(series, int(high_threshold))
+    
+    if unique_count > high_threshold:
+        # Mostly-unique columns (IDs, emails) have no meaningful top values
+        return {
+            "unique_values": None,
+            "top_values": {},
+            "cardinality": "high"
+        }
+    
+    if counts is None:
+        counts = series.value_counts(sort=False)
+    
+    return {
+        "unique_values": unique_count,
+        # nlargest avoids fully sorting the counts
+        "top_values": counts.nlargest(10).to_dict(),
+        "cardinality": "medium" if unique_count > 10 else "low"
+    }
+
+
+def _analyze_sync(dataset_id: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """Load a dataset and build its full analysis.
+    
+    Runs in the analysis process pool, so everything it returns must be picklable.
+    """
+    file_path = metadata["file_path"]
+    df = _load_dataframe(file_path, os.path.splitext(file_path)[1])
+    
+    # Comprehensive dataset analysis
+    
+    # Column type categorization
+    numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
+    categorical_cols = df.select_dtypes(include=['object', 'category']).columns.tolist()
+    datetime_cols = df.select_dtypes(include=['datetime', 'datetime64']).columns.tolist()
+    boolean_cols = df.select_dtypes(include=['bool']).columns.tolist()
+    
+    # Missing values analysis
+    nulls = df.isnull().sum()
+    total_nulls = int(nulls.sum())
+    missing_values = nulls.to_dict()
+    missing_percentages = (nulls / len(df) * 100).round(2).to_dict()
+    
+    # Duplicate analysis
+    duplicate_rows = int(df.duplicated().sum())
+    
+    # Memory usage
+    memory_usage = df.memory_usage(deep=True).to_dict()
+    total_memory_mb = round(sum(memory_usage.values()) / (1024 * 1024), 2)
+    
+    # Statistical summary for numeric columns
+    numeric_stats = _numeric_stats(df, numeric_cols) if numeric_cols else {}
+    
+    # Categorical columns analysis
+    categorical_stats = {
+        col: _categorical_stats(df[col], len(df))
+        for col in categorical_cols
+    }
+    
+    # Datetime columns analysis
+    datetime_stats = {}
+    for col in datetime_cols:
+        min_date = df[col].min()
+        max_date = df[col].max()
+        datetime_stats[col] = {
+            "min_date": str(min_date),
+            "max_date": str(max_date),
+            "range_days": (max_date - min_date).days if pd.notna(min_date) else None
+        }
+    
+    # Correlation analysis (only for numeric columns)
+    correlations = {}
+    if len(numeric_cols) > 1:
+        corr_matrix = df[numeric_cols].corr()
+        col_names = corr_matrix.columns.tolist()
+        # Find high correlations in the upper triangle (excluding diagonal)
+        corr_values = corr_matrix.to_numpy()
+        rows, cols = np.triu_indices_from(corr_values, k=1)
+        pair_values = corr_values[rows, cols]
+        mask = np.abs(pair_values) > 0.7  # High correlation threshold
+        correlations["high_correlations"] = [
+            {
+                "col1": col_names[i],
+                "col2": col_names[j],
+                "correlation": round(float(corr_val), 3)
+            }
+            for i, j, corr_val in zip(rows[mask], cols[mask], pair_values[mask])
+        ]
+    
+    # Data quality score
+    total_cells = df.shape[0] * df.shape[1]
+    completeness_score = round((1 - total_nulls / total_cells) * 100, 2)
+    uniqueness_score = round((1 - duplicate_rows / len(df)) * 100, 2) if len(df) > 0 else 100
+    data_quality_score = round((completeness_score + uniqueness_score) / 2, 2)
+    
+    # Build comprehensive response
+    analysis_result = {
+        "dataset_id": dataset_id,
+        "filename": metadata["filename"],
+        "file_type": metadata["file_type"],
+        
+        # Basic info
+        "basic_info": {
+            "rows": len(df),
+            "columns": len(df.columns),
+            "total_cells": total_cells,
+            "column_names": df.columns.tolist(),
+            "dtypes": df.dtypes.astype(str).to_dict(),
+            "shape": df.shape
+        },
+        
+        # Column categorization
+        "column_types": {
+            "numeric_columns": numeric_cols,
+            "categorical_columns": categorical_cols,
+            "datetime_columns": datetime_cols,
+            "boolean_columns": boolean_cols,
+            "numeric_count": len(numeric_cols),
+            "categorical_count": len(categorical_cols),
+            "datetime_count": len(datetime_cols),
+            "boolean_count": len(boolean_cols)
+        },
+        
+        # Missing values
+        "missing_values": {
+            "by_column": missing_values,
+            "percentages": missing_percentages,
+            "total_missing": total_nulls,
+            "columns_with_missing": [col for col, val in missing_values.items() if val > 0]
+        },
+        
+        # Duplicates
+        "duplicates": {
+            "duplicate_rows": duplicate_rows,
+            "duplicate_percentage": round(duplicate_rows / len(df) * 100, 2) if len(df) > 0 else 0
+        },
+        
+        # Memory
+        "memory_usage": {
+            "by_column_bytes": memory_usage,
+            "total_memory_mb": total_memory_mb,
+            "avg_row_size_bytes": round(sum(memory_usage.values()) / len(df), 2) if len(df) > 0 else 0
+        },
+        
+        # Statistical analysis
+        "statistics": {
+            "numeric_columns": numeric_stats,
+            "categorical_columns": categorical_stats,
+            "datetime_columns": datetime_stats
+        },
+        
+        # Correlations
+        "correlations": correlations,
+        
+        # Data quality
+        "data_quality": {
+            "overall_score": data_quality_score,
+            "completeness_score": completeness_score,
+            "uniqueness_score": uniqueness_score,
+            "quality_level": "excellent" if data_quality_score >= 90 else "good" if data_quality_score >= 70 else "fair" if data_quality_score >= 50 else "poor"
+        },
+        
+        # Preview
+        "preview": {
+            "head": _preview_records(df.head(5)),
+            "tail": _preview_records(df.tail(5))
+        }
+    }
+
+    return analysis_result
+
+
+async def _run_analysis(request: Request, dataset_id: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """Run _analyze_sync in the app's process pool (when it provides one).
+    
+    A pool whose worker died (e.g. killed by the OOM killer) rejects every
+    later submission, so a broken pool is replaced and the analysis retried once.
+    """
+    loop = asyncio.get_running_loop()
+    pool = getattr(request.app.state, "pool", None)
+    try:
+        return await loop.run_in_executor(pool, _analyze_sync, dataset_id, metadata)
+    except BrokenProcessPool:
+        # Concurrent requests may all see the same broken pool; only the first replaces it
+        if request.app.state.pool is pool:
+            request.app.state.pool = create_analysis_pool()
+            pool.shutdown(wait=False, cancel_futures=True)
+        return await loop.run_in_executor(request.app.state.pool, _analyze_sync, dataset_id, metadata)
 
-# Supported file types
-SUPPORTED_EXTENSIONS = {'.csv', '.xlsx', '.xls', '.json', '.parquet'}
 
 @api_router.get("/")
 async def api_root():
@@ -33,324 +599,177 @@ async def upload_dataset(file: UploadFile = File(...)):
     if not file.filename:
         raise HTTPException(status_code=400, detail="No filename provided")
     
-    file_ext = Path(file.filename).suffix.lower()
+    filename = file.filename.lower()
     
-    if file_ext not in SUPPORTED_EXTENSIONS:
+    if not filename.endswith(SUPPORTED_EXTENSIONS):
         raise HTTPException(
             status_code=400,
             detail=f"Unsupported file type. Supported formats: {', '.join(SUPPORTED_EXTENSIONS)}"
         )
     
-    # Validate file size
-    file_content = await file.read()
-    file_size = len(file_content)
+    file_ext = '.' + filename.rsplit('.', 1)[1]
     
-    if file_size > settings.MAX_UPLOAD_SIZE:
+    # Stream to a temporary path; the final name depends on the content hash
+    upload_path = os.path.join(settings.TEMP_DIR, f"{uuid.uuid4()}.upload")
+    
+    # Stream the upload to disk in chunks, enforcing the size limit as we go
+    try:
+        file_size, content_hash = await asyncio.to_thread(
+            _save_upload, file.file, upload_path, settings.MAX_UPLOAD_SIZE
+        )
+        if file_size > settings.MAX_UPLOAD_SIZE:
+            raise HTTPException(
+                status_code=413,
+                detail=f"File too large. Maximum size is {settings.MAX_UPLOAD_SIZE / (1024*1024):.0f}MB"
+            )
+    
+    except Exception as e:
+        # Clean up the partially written file
+        Path(upload_path).unlink(missing_ok=True)
+        if isinstance(e, HTTPException):
+            raise
         raise HTTPException(
-            status_code=413,
-            detail=f"File too large. Maximum size is {settings.MAX_UPLOAD_SIZE / (1024*1024):.0f}MB"
+            status_code=500,
+            detail=f"Error saving file: {str(e)}"
         )
     
     if file_size == 0:
+        Path(upload_path).unlink(missing_ok=True)
         raise HTTPException(status_code=400, detail="Empty file uploaded")
     
-    # Generate unique dataset ID
-    dataset_id = str(uuid.uuid4())
-    file_path = os.path.join(settings.TEMP_DIR, f"{dataset_id}{file_ext}")
+    # Identical content gets the same dataset ID, so re-uploads reuse earlier work.
+    # The extension is part of the ID because it decides how the bytes are parsed
+    dataset_id = f"{content_hash}-{file_ext[1:]}"
+    file_path = os.path.join(settings.TEMP_DIR, f"{content_hash}{file_ext}")
+    
+    existing_info = datasets_metadata.get(dataset_id)
+    if (
+        existing_info is not None
+        and existing_info["file_size"] == file_size
+        and os.path.exists(file_path)
+    ):
+        Path(upload_path).unlink(missing_ok=True)
+        return NumpyORJSONResponse({
+            "status": "success",
+            "message": "Dataset already uploaded",
+            "data": {**existing_info, "filename": file.filename}
+        })
+    
+    os.replace(upload_path, file_path)
     
+    # Read with pandas based on file type and validate
     try:
-        # Save file temporarily
-        async with aiofiles.open(file_path, 'wb') as f:
-            await f.write(file_content)
-        
-        # Read with pandas based on file type and validate
-        try:
-            df = None
-            
-            if file_ext == '.csv':
-                df = pd.read_csv(file_path)
-            elif file_ext in ['.xlsx', '.xls']:
-                df = pd.read_excel(file_path)
-            elif file_ext == '.json':
-                df = pd.read_json(file_path)
-            elif file_ext == '.parquet':
-                df = pd.read_parquet(file_path)
-            
-            # Basic validation
-            if df is None:
-                raise HTTPException(status_code=400, detail="Failed to read file")
-            
-            if df.empty:
+        # Parquet footers record the row count, so empty files are rejected
+        # before any data is materialized
+        if file_ext == '.parquet':
+            parquet_metadata = await asyncio.to_thread(pq.read_metadata, file_path)
+            if parquet_metadata.num_rows == 0:
                 raise HTTPException(status_code=400, detail="File contains no data")
-            
-            if len(df.columns) == 0:
-                raise HTTPException(status_code=400, detail="File has no columns")
-            
-            # Get dataset info
-            numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
-            categorical_cols = df.select_dtypes(include=['object', 'category']).columns.tolist()
-            datetime_cols = df.select_dtypes(include=['datetime']).columns.tolist()
-            
-            dataset_info = {
-                "dataset_id": dataset_id,
-                "filename": file.filename,
-                "file_type": file_ext.replace('.', '').upper(),
-                "file_size": file_size,
-                "file_size_mb": round(file_size / (1024 * 1024), 2),
-                "rows": len(df),
-                "columns": len(df.columns),
-                "column_names": df.columns.tolist(),
-                "dtypes": df.dtypes.astype(str).to_dict(),
-                "numeric_columns": numeric_cols,
-                "categorical_columns": categorical_cols,
-                "datetime_columns": datetime_cols,
-                "missing_values": df.isnull().sum().to_dict(),
-                "total_missing": int(df.isnull().sum().sum()),
-                "duplicate_rows": int(df.duplicated().sum()),
-                "memory_usage_mb": round(df.memory_usage(deep=True).sum() / (1024 * 1024), 2),
-                "file_path": file_path,
-                "preview": df.head(5).to_dict('records')  # First 5 rows preview
-            }
-            
-            # Store metadata for later retrieval
-            datasets_metadata[dataset_id] = dataset_info
-            
-            return {
-                "status": "success",
-                "message": "Dataset uploaded and validated successfully",
-                "data": dataset_info
-            }
-            
-        except pd.errors.EmptyDataError:
-            # Clean up the file
-            if os.path.exists(file_path):
-                os.remove(file_path)
-            raise HTTPException(status_code=400, detail="File is empty or invalid")
         
-        except pd.errors.ParserError as e:
-            # Clean up the file
-            if os.path.exists(file_path):
-                os.remove(file_path)
-            raise HTTPException(
-                status_code=400,
-                detail=f"Failed to parse file: {str(e)}"
-            )
+        df = await asyncio.to_thread(_read_dataframe, file_path, file_ext)
         
-        except ValueError as e:
-            # Clean up the file
-            if os.path.exists(file_path):
-                os.remove(file_path)
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid file format: {str(e)}"
-            )
+        # Basic validation
+        if df is None:
+            raise HTTPException(status_code=400, detail="Failed to read file")
+        
+        if df.empty:
+            raise HTTPException(status_code=400, detail="File contains no data")
+        
+        if len(df.columns) == 0:
+            raise HTTPException(status_code=400, detail="File has no columns")
+        
+        # Get dataset info
+        numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
+        categorical_cols = df.select_dtypes(include=['object', 'category']).columns.tolist()
+        datetime_cols = df.select_dtypes(include=['datetime']).columns.tolist()
+        nulls = df.isnull().sum()
+        
+        dataset_info = {
+            "dataset_id": dataset_id,
+            "filename": file.filename,
+            "file_type": file_ext.replace('.', '').upper(),
+            "file_size": file_size,
+            "file_size_mb": round(file_size / (1024 * 1024), 2),
+            "rows": len(df),
+            "columns": len(df.columns),
+            "column_names": df.columns.tolist(),
+            "dtypes": df.dtypes.astype(str).to_dict(),
+            "numeric_columns": numeric_cols,
+            "categorical_columns": categorical_cols,
+            "datetime_columns": datetime_cols,
+            "missing_values": nulls.to_dict(),
+            "total_missing": int(nulls.sum()),
+            "duplicate_rows": int(df.duplicated().sum()),
+            "memory_usage_mb": round(df.memory_usage(deep=True).sum() / (1024 * 1024), 2),
+            "file_path": file_path,
+            "preview": _preview_records(df.head(5))  # First 5 rows preview
+        }
+        
+        # Keep a parquet copy so analysis doesn't have to re-parse the original
+        if file_ext != '.parquet':
+            await asyncio.to_thread(_write_sidecar, df, file_path)
+        
+        # Store metadata for later retrieval
+        datasets_metadata[dataset_id] = dataset_info
+        _analysis_cache.pop(dataset_id, None)
+        
+        return NumpyORJSONResponse({
+            "status": "success",
+            "message": "Dataset uploaded and validated successfully",
+            "data": dataset_info
+        })
         
-        except Exception as e:
-            # Clean up the file
-            if os.path.exists(file_path):
-                os.remove(file_path)
-            raise HTTPException(
-                status_code=500,
-                detail=f"Error processing file: {str(e)}"
-            )
-    
     except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error saving file: {str(e)}"
-        )
+        # Clean up the file and any parquet copy already written, unless a
+        # concurrent upload of the same content has registered them meanwhile
+        if dataset_id not in datasets_metadata:
+            Path(file_path).unlink(missing_ok=True)
+            Path(_sidecar_path(file_path)).unlink(missing_ok=True)
+        raise _upload_error(e)
 
 
 @api_router.post("/dataset/analyze")
-async def analyze_dataset(dataset_id: str):
+async def analyze_dataset(dataset_id: str, request: Request):
     """Perform comprehensive analysis on uploaded dataset"""
     
     # Check if dataset exists
-    if dataset_id not in datasets_metadata:
+    metadata = datasets_metadata.get(dataset_id)
+    if metadata is None:
         raise HTTPException(status_code=404, detail="Dataset not found")
     
-    metadata = datasets_metadata[dataset_id]
     file_path = metadata["file_path"]
     
     if not os.path.exists(file_path):
         raise HTTPException(status_code=404, detail="Dataset file not found")
     
+    # Return the cached result if this dataset was already analyzed
+    cached_result = _analysis_cache.get(dataset_id)
+    if cached_result is not None:
+        _analysis_cache.move_to_end(dataset_id)
+        return NumpyORJSONResponse({
+            "status": "success",
+            "message": "Dataset analyzed successfully",
+            "data": cached_result,
+            "cached": True
+        })
+    
+    if os.path.splitext(file_path)[1] not in _READERS:
+        raise HTTPException(status_code=400, detail="Unsupported file type")
+    
     try:
-        # Load dataset based on file type
-        file_ext = Path(file_path).suffix.lower()
-        
-        if file_ext == '.csv':
-            df = pd.read_csv(file_path)
-        elif file_ext in ['.xlsx', '.xls']:
-            df = pd.read_excel(file_path)
-        elif file_ext == '.json':
-            df = pd.read_json(file_path)
-        elif file_ext == '.parquet':
-            df = pd.read_parquet(file_path)
-        else:
-            raise HTTPException(status_code=400, detail="Unsupported file type")
-        
-        # Comprehensive dataset analysis
-        
-        # Column type categorization
-        numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
-        categorical_cols = df.select_dtypes(include=['object', 'category']).columns.tolist()
-        datetime_cols = df.select_dtypes(include=['datetime', 'datetime64']).columns.tolist()
-        boolean_cols = df.select_dtypes(include=['bool']).columns.tolist()
-        
-        # Missing values analysis
-        missing_values = df.isnull().sum().to_dict()
-        missing_percentages = (df.isnull().sum() / len(df) * 100).round(2).to_dict()
-        
-        # Duplicate analysis
-        duplicate_rows = int(df.duplicated().sum())
-        
-        # Memory usage
-        memory_usage = df.memory_usage(deep=True).to_dict()
-        total_memory_mb = round(sum(memory_usage.values()) / (1024 * 1024), 2)
-        
-        # Statistical summary for numeric columns
-        numeric_stats = {}
-        if numeric_cols:
-            stats_df = df[numeric_cols].describe()
-            for col in numeric_cols:
-                numeric_stats[col] = {
-                    "count": int(stats_df.loc['count', col]),
-                    "mean": float(stats_df.loc['mean', col]) if not pd.isna(stats_df.loc['mean', col]) else None,
-                    "std": float(stats_df.loc['std', col]) if not pd.isna(stats_df.loc['std', col]) else None,
-                    "min": float(stats_df.loc['min', col]) if not pd.isna(stats_df.loc['min', col]) else None,
-                    "25%": float(stats_df.loc['25%', col]) if not pd.isna(stats_df.loc['25%', col]) else None,
-                    "50%": float(stats_df.loc['50%', col]) if not pd.isna(stats_df.loc['50%', col]) else None,
-                    "75%": float(stats_df.loc['75%', col]) if not pd.isna(stats_df.loc['75%', col]) else None,
-                    "max": float(stats_df.loc['max', col]) if not pd.isna(stats_df.loc['max', col]) else None,
-                    "skewness": float(df[col].skew()) if not pd.isna(df[col].skew()) else None,
-                    "kurtosis": float(df[col].kurtosis()) if not pd.isna(df[col].kurtosis()) else None,
-                    "zeros_count": int((df[col] == 0).sum()),
-                    "negative_count": int((df[col] < 0).sum()) if df[col].dtype in ['int64', 'float64'] else 0
-                }
+        # The analysis is CPU-bound, so it runs in the process pool to keep
+        # this worker's event loop and GIL free
+        analysis_result = await _run_analysis(request, dataset_id, metadata)
         
-        # Categorical columns analysis
-        categorical_stats = {}
-        for col in categorical_cols:
-            unique_count = df[col].nunique()
-            categorical_stats[col] = {
-                "unique_values": unique_count,
-                "top_values": df[col].value_counts().head(10).to_dict(),
-                "cardinality": "high" if unique_count > len(df) * 0.5 else "medium" if unique_count > 10 else "low"
-            }
-        
-        # Datetime columns analysis
-        datetime_stats = {}
-        for col in datetime_cols:
-            datetime_stats[col] = {
-                "min_date": str(df[col].min()),
-                "max_date": str(df[col].max()),
-                "range_days": (df[col].max() - df[col].min()).days if pd.notna(df[col].min()) else None
-            }
+        _lru_put(_analysis_cache, dataset_id, analysis_result, settings.ANALYSIS_CACHE_SIZE)
         
-        # Correlation analysis (only for numeric columns)
-        correlations = {}
-        if len(numeric_cols) > 1:
-            corr_matrix = df[numeric_cols].corr()
-            # Find high correlations (excluding diagonal)
-            high_corr = []
-            for i in range(len(corr_matrix.columns)):
-                for j in range(i+1, len(corr_matrix.columns)):
-                    corr_val = corr_matrix.iloc[i, j]
-                    if abs(corr_val) > 0.7:  # High correlation threshold
-                        high_corr.append({
-                            "col1": corr_matrix.columns[i],
-                            "col2": corr_matrix.columns[j],
-                            "correlation": round(float(corr_val), 3)
-                        })
-            correlations["high_correlations"] = high_corr
-        
-        # Data quality score
-        total_cells = df.shape[0] * df.shape[1]
-        missing_cells = df.isnull().sum().sum()
-        completeness_score = round((1 - missing_cells / total_cells) * 100, 2)
-        uniqueness_score = round((1 - duplicate_rows / len(df)) * 100, 2) if len(df) > 0 else 100
-        data_quality_score = round((completeness_score + uniqueness_score) / 2, 2)
-        
-        # Build comprehensive response
-        analysis_result = {
-            "dataset_id": dataset_id,
-            "filename": metadata["filename"],
-            "file_type": metadata["file_type"],
-            
-            # Basic info
-            "basic_info": {
-                "rows": len(df),
-                "columns": len(df.columns),
-                "total_cells": total_cells,
-                "column_names": df.columns.tolist(),
-                "dtypes": df.dtypes.astype(str).to_dict(),
-                "shape": df.shape
-            },
-            
-            # Column categorization
-            "column_types": {
-                "numeric_columns": numeric_cols,
-                "categorical_columns": categorical_cols,
-                "datetime_columns": datetime_cols,
-                "boolean_columns": boolean_cols,
-                "numeric_count": len(numeric_cols),
-                "categorical_count": len(categorical_cols),
-                "datetime_count": len(datetime_cols),
-                "boolean_count": len(boolean_cols)
-            },
-            
-            # Missing values
-            "missing_values": {
-                "by_column": missing_values,
-                "percentages": missing_percentages,
-                "total_missing": int(missing_cells),
-                "columns_with_missing": [col for col, val in missing_values.items() if val > 0]
-            },
-            
-            # Duplicates
-            "duplicates": {
-                "duplicate_rows": duplicate_rows,
-                "duplicate_percentage": round(duplicate_rows / len(df) * 100, 2) if len(df) > 0 else 0
-            },
-            
-            # Memory
-            "memory_usage": {
-                "by_column_bytes": memory_usage,
-                "total_memory_mb": total_memory_mb,
-                "avg_row_size_bytes": round(sum(memory_usage.values()) / len(df), 2) if len(df) > 0 else 0
-            },
-            
-            # Statistical analysis
-            "statistics": {
-                "numeric_columns": numeric_stats,
-                "categorical_columns": categorical_stats,
-                "datetime_columns": datetime_stats
-            },
-            
-            # Correlations
-            "correlations": correlations,
-            
-            # Data quality
-            "data_quality": {
-                "overall_score": data_quality_score,
-                "completeness_score": completeness_score,
-                "uniqueness_score": uniqueness_score,
-                "quality_level": "excellent" if data_quality_score >= 90 else "good" if data_quality_score >= 70 else "fair" if data_quality_score >= 50 else "poor"
-            },
-            
-            # Preview
-            "preview": {
-                "head": df.head(5).to_dict('records'),
-                "tail": df.tail(5).to_dict('records')
-            }
-        }
-        
-        return {
+        # Returned directly so FastAPI skips the jsonable_encoder walk over the payload
+        return NumpyORJSONResponse({
             "status": "success",
             "message": "Dataset analyzed successfully",
-            "data": analysis_result
-        }
+            "data": analysis_result,
+            "cached": False
+        })
         
     except Exception as e:
         raise HTTPException(
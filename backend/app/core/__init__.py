@@ -1,3 +1,5 @@
 from .config import settings
+from .responses import NumpyORJSONResponse
+from .pool import create_analysis_pool, server_worker_count
 
-__all__ = ["settings"]
+__all__ = ["settings", "NumpyORJSONResponse", "create_analysis_pool", "server_worker_count"]
@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import List, Optional
 
 
 class Settings(BaseSettings):
@@ -11,6 +11,7 @@ class Settings(BaseSettings):
     HOST: str = "0.0.0.0"
     PORT: int = 8000
     DEBUG: bool = True
+    SERVER_WORKERS: Optional[int] = None  # uvicorn workers when DEBUG is off (defaults to CPU count)
     
     # CORS settings
     ALLOWED_ORIGINS: List[str] = [
@@ -26,6 +27,8 @@ class Settings(BaseSettings):
     MAX_UPLOAD_SIZE: int = 100 * 1024 * 1024  # 100MB
     TEMP_DIR: str = "./temp"
     MODELS_DIR: str = "./models"
+    ANALYSIS_CACHE_SIZE: int = 64  # Analysis results kept in memory
+    ANALYSIS_WORKERS: Optional[int] = None  # Analysis processes per server worker (defaults to an even share of the cores)
     
     class Config:
         env_file = ".env"
@@ -0,0 +1,28 @@
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import os
+
+from .config import settings
+
+
+def server_worker_count() -> int:
+    """Number of uvicorn worker processes the server runs with"""
+    if settings.DEBUG:
+        # The reloader only supports a single worker
+        return 1
+    return settings.SERVER_WORKERS or os.cpu_count() or 1
+
+
+def create_analysis_pool() -> ProcessPoolExecutor:
+    """Create the process pool that runs dataset analysis.
+    
+    Each server worker owns a pool, so by default the cores are split between
+    them rather than every worker starting one process per core. Processes are
+    spawned instead of forked because the server process is multi-threaded
+    (asyncio.to_thread, Polars' thread pool) and forking it can deadlock.
+    """
+    max_workers = settings.ANALYSIS_WORKERS or max(1, (os.cpu_count() or 1) // server_worker_count())
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn")
+    )
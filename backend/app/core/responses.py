@@ -0,0 +1,18 @@
+from fastapi.responses import JSONResponse
+from typing import Any
+import orjson
+
+
+class NumpyORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson.
+    
+    Serializes numpy scalars and arrays natively and accepts non-string dict
+    keys (e.g. integer column names or value counts), which the stdlib encoder
+    rejects.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        )
@@ -1,25 +1,33 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from contextlib import asynccontextmanager
+import sys
 import uvicorn
 
 from app.api.routes import api_router
 from app.core.config import settings
+from app.core.responses import NumpyORJSONResponse
+from app.core.pool import create_analysis_pool, server_worker_count
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup logic
     print("🚀 Starting Flownix Backend Server...")
+    # Dataset analysis is CPU-bound, so it runs in separate processes
+    app.state.pool = create_analysis_pool()
     yield
     # Shutdown logic
     print("👋 Shutting down Flownix Backend Server...")
+    app.state.pool.shutdown(cancel_futures=True)
 
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
     description="Intelligent ML Pipeline Engine Backend API",
+    default_response_class=NumpyORJSONResponse,
     lifespan=lifespan
 )
 
@@ -32,6 +40,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger responses (e.g. dataset analysis JSON) for clients that accept gzip
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Include API routes
 app.include_router(api_router, prefix=settings.API_PREFIX)
 
@@ -55,5 +66,9 @@ if __name__ == "__main__":
         "main:app",
         host=settings.HOST,
         port=settings.PORT,
-        reload=settings.DEBUG
+        # uvloop is not available on Windows; use the stdlib loop there
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        reload=settings.DEBUG,
+        workers=None if settings.DEBUG else server_worker_count()
     )
@@ -130,7 +130,7 @@ export interface NumericStats {
 }
 
 export interface CategoricalStats {
-    unique_values: number;
+    unique_values: number | null;
     top_values: Record<string, number>;
     cardinality: 'high' | 'medium' | 'low';
 }
@@ -147,7 +147,9 @@ export interface HighCorrelation {
     correlation: number;
 }
 
-export type AnalysisResponse = ApiResponse<AnalysisResult>;
+export type AnalysisResponse = ApiResponse<AnalysisResult> & {
+    cached?: boolean; // True when the result was served from the server's analysis cache
+};
 
 // Pipeline Generation Response
 export interface PipelineInfo {
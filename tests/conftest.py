@@ -0,0 +1,7 @@
+import os
+import sys
+import tempfile
+
+# Make the backend package importable and keep uploads out of the working tree
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "backend"))
+os.environ.setdefault("TEMP_DIR", tempfile.mkdtemp(prefix="flownix-tests-"))
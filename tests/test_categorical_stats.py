@@ -0,0 +1,37 @@
+import pandas as pd
+import pytest
+
+from app.api.routes import _categorical_stats, _distinct_count_capped
+
+
+def test_distinct_count_capped_is_exact_up_to_the_cap():
+    series = pd.Series(["a", "b", None, "a", "c"])
+    
+    assert _distinct_count_capped(series, 10) == 3
+    assert _distinct_count_capped(series, 3) == 3
+
+
+def test_distinct_count_capped_stops_past_the_cap():
+    series = pd.Series([f"v{i}" for i in range(200_000)])
+    
+    count = _distinct_count_capped(series, 1000)
+    
+    assert 1000 < count < len(series)
+
+
+@pytest.mark.parametrize("dtype", [object, "category"])
+@pytest.mark.parametrize("n_unique, cardinality", [(3, "low"), (20, "medium"), (60, "high")])
+def test_categorical_stats_cardinality(dtype, n_unique, cardinality):
+    n_rows = 100
+    series = pd.Series([f"v{i % n_unique}" for i in range(n_rows)], dtype=dtype)
+    
+    stats = _categorical_stats(series, n_rows)
+    
+    assert stats["cardinality"] == cardinality
+    if cardinality == "high":
+        assert stats["unique_values"] is None
+        assert stats["top_values"] == {}
+    else:
+        assert stats["unique_values"] == n_unique
+        assert len(stats["top_values"]) == min(n_unique, 10)
+        assert sum(stats["top_values"].values()) <= n_rows
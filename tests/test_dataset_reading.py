@@ -0,0 +1,74 @@
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.api.routes import _analyze_sync, _dedupe_columns, _preview_records, _read_dataframe
+
+
+def test_csv_duplicate_headers_are_renamed(tmp_path):
+    file_path = tmp_path / "dup.csv"
+    file_path.write_text("a,a\n1,2\n3,4\n")
+    
+    df = _read_dataframe(str(file_path), ".csv")
+    
+    assert df.columns.tolist() == ["a", "a.1"]
+    assert df["a.1"].tolist() == [2, 4]
+
+
+@pytest.mark.parametrize("header", ["a,a,a.1", "a,a,a,a.1,a.2", "a,a.1,a,a.1,a", "x,y,x,y,x.1"])
+def test_dedupe_columns_matches_c_parser(header):
+    values = ",".join(["0"] * len(header.split(",")))
+    expected = pd.read_csv(io.StringIO(f"{header}\n{values}\n"), engine="c").columns.tolist()
+    
+    assert _dedupe_columns(pd.Index(header.split(","))) == expected
+
+
+def test_csv_duplicate_headers_can_be_analyzed(tmp_path):
+    file_path = tmp_path / "dup.csv"
+    file_path.write_text("a,a\n1,2\n3,4\n")
+    metadata = {"file_path": str(file_path), "filename": "dup.csv", "file_type": ".csv"}
+    
+    result = _analyze_sync("dup", metadata)
+    
+    assert result["basic_info"]["column_names"] == ["a", "a.1"]
+    assert set(result["statistics"]["numeric_columns"]) == {"a", "a.1"}
+
+
+def test_csv_text_columns_split_by_cardinality(tmp_path):
+    file_path = tmp_path / "text.csv"
+    rows = [f"{i},{'ab'[i % 2]},{i if i < 6 else 'x'}" for i in range(10)]
+    file_path.write_text("uid,cat,mix\n" + "\n".join(rows) + "\n")
+    
+    df = _read_dataframe(str(file_path), ".csv")
+    
+    assert df["cat"].dtype == "category"
+    assert list(df["cat"].cat.categories) == ["a", "b"]
+    # Mixed numbers and text parse as strings, which parquet can store
+    assert df["mix"].dtype == object
+    df.to_parquet(tmp_path / "text.pq")
+
+
+def test_csv_types_widen_past_the_first_block(tmp_path):
+    # The streaming reader infers types from the first 1MB block only
+    file_path = tmp_path / "late.csv"
+    rows = [f"{i},{i},{i}" for i in range(200_000)]
+    file_path.write_text("n,f,s\n" + "\n".join(rows) + "\n1,1.5,x\n")
+    
+    df = _read_dataframe(str(file_path), ".csv")
+    
+    assert df["n"].dtype == "int32"
+    assert df["f"].dtype == "float64"
+    assert df["f"].iloc[-1] == 1.5
+    assert df["s"].dtype == object
+    assert df["s"].iloc[-1] == "x"
+
+
+def test_preview_floats_round_trip():
+    df = pd.DataFrame({"x": [0.1 + 0.2, 1 / 3, np.nan], "s": ["a", None, "c"]})
+    
+    records = _preview_records(df)
+    
+    assert [r["x"] for r in records] == [0.1 + 0.2, 1 / 3, None]
+    assert [r["s"] for r in records] == ["a", None, "c"]
@@ -0,0 +1,49 @@
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.api.routes import _numeric_stats
+
+
+def _frame():
+    rng = np.random.default_rng(0)
+    n = 50
+    floats = rng.normal(10, 3, n)
+    floats[::7] = np.nan
+    return pd.DataFrame({
+        "float_nan": floats,
+        "int8": rng.integers(-100, 100, n).astype(np.int8),
+        "uint8": rng.integers(0, 255, n).astype(np.uint8),
+        "all_nan": np.full(n, np.nan),
+        "constant": np.full(n, 7, dtype=np.int64),
+        "near_constant": np.full(n, 1 / 3),
+        "skewed": rng.exponential(2, n),
+        "two_values": [1.0, 2.0] + [np.nan] * (n - 2),
+        "three_values": [1.0, 2.0, 4.0] + [np.nan] * (n - 3),
+    })
+
+
+def _as_float(value):
+    return None if value is None or math.isnan(value) else float(value)
+
+
+@pytest.mark.parametrize("col", list(_frame().columns))
+def test_numeric_stats_match_pandas(col):
+    df = _frame()
+    stats = _numeric_stats(df, list(df.columns))[col]
+    series = df[col]
+    expected = series.describe().to_dict()
+    expected["skewness"] = series.skew()
+    expected["kurtosis"] = series.kurt()
+    
+    assert stats["count"] == int(expected["count"])
+    for key in ("mean", "std", "min", "25%", "50%", "75%", "max", "skewness", "kurtosis"):
+        want = _as_float(expected[key])
+        if want is None:
+            assert stats[key] is None, key
+        else:
+            assert stats[key] == pytest.approx(want, rel=1e-9, abs=1e-12), key
+    assert stats["zeros_count"] == int((series == 0).sum())
+    assert stats["negative_count"] == int((series < 0).sum())